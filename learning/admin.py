@@ -1,6 +1,7 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 from django.contrib.auth.models import User
+from django.db.models import Count
 from .models import (
     LearnerProfile, AdminProfile, Course, Module, ChatSession, 
     CourseEnrollment, EnrollmentRequest, Quiz, QuizQuestion, 
@@ -103,6 +104,7 @@ class QuizQuestionAdmin(admin.ModelAdmin):
     search_fields = ['question_text']
     inlines = [QuizOptionInline]
     ordering = ['quiz', 'order']
+    list_select_related = ['quiz__module']
     
     def question_text_short(self, obj):
         return obj.question_text[:50] + '...' if len(obj.question_text) > 50 else obj.question_text
@@ -116,10 +118,16 @@ class QuizAdmin(admin.ModelAdmin):
     search_fields = ['title', 'description', 'module__title', 'module__course__title']
     readonly_fields = ['created_at', 'updated_at']
     date_hierarchy = 'created_at'
+    list_select_related = ['module__course']
+    
+    def get_queryset(self, request):
+        # Count questions in the list query instead of one COUNT per row
+        return super().get_queryset(request).annotate(num_questions=Count('questions'))
     
     def question_count(self, obj):
-        return obj.questions.count()
+        return obj.num_questions
     question_count.short_description = 'Questions'
+    question_count.admin_order_field = 'num_questions'
 
 
 @admin.register(QuizOption)
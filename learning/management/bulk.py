@@ -0,0 +1,16 @@
+"""
+Helpers shared by the seed_* management commands
+"""
+
+
+def set_bulk_pks(objs, queryset, *keys):
+    """
+    Fill in primary keys after bulk_create on backends that don't return them (MySQL).
+
+    The rows are looked up in queryset and matched to objs on the given key
+    fields, which must identify each row uniquely within queryset.
+    """
+    if objs and objs[0].pk is None:
+        pks = {tuple(row[:-1]): row[-1] for row in queryset.values_list(*keys, 'pk')}
+        for obj in objs:
+            obj.pk = pks[tuple(getattr(obj, key) for key in keys)]
@@ -2,76 +2,141 @@
 Management command to seed RESTful API (JAX-RS) course with complete modules and topics
 Run with: python manage.py seed_jaxrs_course
 """
+import hashlib
+import json
+
 from django.core.management.base import BaseCommand
+from django.db import transaction
+from learning.management.bulk import set_bulk_pks
 from learning.models import Course, Module, Quiz, QuizQuestion, QuizOption
 
+COURSE_TITLE = 'RESTful API (JAX-RS) COURSE – Complete Modules & Topics'
+
 
 class Command(BaseCommand):
     help = 'Seeds the database with RESTful API (JAX-RS) course, modules, and quizzes with MCQ questions'
 
-    def handle(self, *args, **options):
-        # Create or get JAX-RS course
-        course, created = Course.objects.get_or_create(
-            title='RESTful API (JAX-RS) COURSE – Complete Modules & Topics',
-            defaults={
-                'description': 'Complete RESTful API course using JAX-RS covering web services, REST principles, JAX-RS setup, Hibernate integration, advanced JAX-RS concepts, and building REST clients.',
-                'category': 'programming',
-                'is_featured': True,
-            }
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Reseed even if the course already holds the current seed data',
         )
-        
-        if created:
-            self.stdout.write(self.style.SUCCESS(f'Created course: {course.title}'))
-        else:
-            self.stdout.write(self.style.WARNING(f'Course already exists: {course.title}. Updating modules...'))
-        
-        # Define modules with their content
+        parser.add_argument(
+            '--modules',
+            nargs='+',
+            type=int,
+            metavar='ORDER',
+            help='Only seed the modules with these order numbers',
+        )
+        parser.add_argument(
+            '--skip-questions',
+            action='store_true',
+            help='Update modules and quizzes without recreating quiz questions',
+        )
+
+    def handle(self, *args, **options):
+        write, ok, warn = self.stdout.write, self.style.SUCCESS, self.style.WARNING
         modules_data = self.get_modules_data()
-        
-        total_questions = 0
-        for module_data in modules_data:
-            module, module_created = Module.objects.update_or_create(
-                course=course,
-                order=module_data['order'],
+        digest = hashlib.sha256(json.dumps(modules_data, sort_keys=True).encode()).hexdigest()
+        skip_questions = options['skip_questions']
+        # The stored digest describes a complete seed, so partial runs neither check nor update it
+        partial = bool(options['modules']) or skip_questions
+
+        # Skip everything when the stored digest shows the data is unchanged
+        if not partial and not options['force'] and Course.objects.filter(title=COURSE_TITLE, seed_hash=digest).exists():
+            write(warn('JAX-RS course is already seeded with this data. Use --force to reseed.'))
+            return
+
+        if options['modules']:
+            modules_data = [m for m in modules_data if m['order'] in options['modules']]
+
+        # Collect output and write it in one go once the seed has committed, so
+        # nothing is reported for work that got rolled back
+        log = []
+        with transaction.atomic():
+            # Create or get JAX-RS course
+            course, created = Course.objects.get_or_create(
+                title=COURSE_TITLE,
                 defaults={
-                    'title': module_data['title'],
-                    'summary': module_data['summary'],
-                    'learning_objectives': module_data['learning_objectives'],
-                    'topics': module_data['topics'],
+                    'description': 'Complete RESTful API course using JAX-RS covering web services, REST principles, JAX-RS setup, Hibernate integration, advanced JAX-RS concepts, and building REST clients.',
+                    'category': 'programming',
+                    'is_featured': True,
                 }
             )
             
-            if module_created:
-                self.stdout.write(self.style.SUCCESS(f'  Created module: {module.title}'))
+            if created:
+                log.append(ok(f'Created course: {course.title}'))
             else:
-                self.stdout.write(self.style.WARNING(f'  Updated module: {module.title}'))
+                log.append(warn(f'Course already exists: {course.title}. Updating modules...'))
             
-            # Create quiz for the module
-            quiz, quiz_created = Quiz.objects.update_or_create(
-                module=module,
-                defaults={
-                    'title': f'{module.title} - Quiz',
-                    'description': f'Assessment quiz for {module.title}',
-                    'passing_score': 70,
-                    'time_limit': 30,
-                }
-            )
+            # Style the fixed message once; only the count changes per module
+            created_questions_msg = ok('    Created %d questions')
+            quiz_questions = []
+            stale_quiz_ids = []
+            for module_data in modules_data:
+                module, module_created = Module.objects.update_or_create(
+                    course=course,
+                    order=module_data['order'],
+                    defaults={
+                        'title': module_data['title'],
+                        'summary': module_data['summary'],
+                        'learning_objectives': module_data['learning_objectives'],
+                        'topics': module_data['topics'],
+                    }
+                )
+                
+                if module_created:
+                    log.append(ok(f'  Created module: {module.title}'))
+                else:
+                    log.append(warn(f'  Updated module: {module.title}'))
+                
+                # Create quiz for the module
+                quiz, quiz_created = Quiz.objects.update_or_create(
+                    module=module,
+                    defaults={
+                        'title': f'{module.title} - Quiz',
+                        'description': f'Assessment quiz for {module.title}',
+                        'passing_score': 70,
+                        'time_limit': 30,
+                    }
+                )
+                
+                if quiz_created:
+                    log.append(ok(f'    Created quiz: {quiz.title}'))
+                else:
+                    log.append(warn(f'    Updated quiz: {quiz.title}'))
+                
+                if skip_questions:
+                    continue
+                
+                if not quiz_created:
+                    stale_quiz_ids.append(quiz.pk)
+                quiz_questions.append((quiz, module_data['questions']))
+                log.append(created_questions_msg % len(module_data['questions']))
             
-            if quiz_created:
-                self.stdout.write(self.style.SUCCESS(f'    Created quiz: {quiz.title}'))
-            else:
-                # Delete existing questions to recreate them
-                quiz.questions.all().delete()
-                self.stdout.write(self.style.WARNING(f'    Updated quiz: {quiz.title}'))
+            if stale_quiz_ids:
+                # Delete existing questions to recreate them. Options go first so the
+                # question delete has no options left to collect; a plain delete() is
+                # kept because user answers still cascade from both tables.
+                QuizOption.objects.filter(question__quiz_id__in=stale_quiz_ids).delete()
+                QuizQuestion.objects.filter(quiz_id__in=stale_quiz_ids).delete()
             
-            # Create questions for the quiz
-            questions_count = self.create_quiz_questions(quiz, module_data['questions'])
-            total_questions += questions_count
-            self.stdout.write(self.style.SUCCESS(f'    Created {questions_count} questions'))
+            # Create questions for every quiz at once
+            total_questions = len(self.create_quiz_questions(quiz_questions))
+            
+            if not partial:
+                Course.objects.filter(pk=course.pk).update(seed_hash=digest)
         
-        self.stdout.write(
-            self.style.SUCCESS(f'\nSuccessfully created/updated RESTful API (JAX-RS) course with {len(modules_data)} modules and {total_questions} total questions!')
-        )
+        if skip_questions:
+            log.append(
+                ok(f'\nSuccessfully created/updated RESTful API (JAX-RS) course with {len(modules_data)} modules; questions left unchanged.')
+            )
+        else:
+            log.append(
+                ok(f'\nSuccessfully created/updated RESTful API (JAX-RS) course with {len(modules_data)} modules and {total_questions} total questions!')
+            )
+        write('\n'.join(log))
 
     def get_modules_data(self):
         """Returns comprehensive module data"""
@@ -118,29 +183,45 @@ class Command(BaseCommand):
             },
         ]
 
-    def create_quiz_questions(self, quiz, questions_data):
-        """Create quiz questions with options"""
-        count = 0
-        for order, question_data in enumerate(questions_data, start=1):
-            question = QuizQuestion.objects.create(
+    def create_quiz_questions(self, quiz_questions):
+        """Create quiz questions with options for all quizzes in two bulk inserts.
+        Returns the created questions so callers can count them without re-querying."""
+        questions_data = [
+            question_data
+            for _, quiz_data in quiz_questions
+            for question_data in quiz_data
+        ]
+        questions = QuizQuestion.objects.bulk_create([
+            QuizQuestion(
                 quiz=quiz,
                 question_text=question_data['question'],
                 question_type='multiple_choice',
                 points=1,
                 order=order
             )
-            
-            # Create options
-            for opt_order, option_text in enumerate(question_data['options'], start=1):
-                is_correct = (opt_order == question_data['correct_answer'])
-                QuizOption.objects.create(
-                    question=question,
-                    option_text=option_text,
-                    is_correct=is_correct,
-                    order=opt_order
-                )
-            count += 1
-        return count
+            for quiz, quiz_data in quiz_questions
+            for order, question_data in enumerate(quiz_data, start=1)
+        ])
+        
+        set_bulk_pks(
+            questions,
+            QuizQuestion.objects.filter(quiz__in=[quiz for quiz, _ in quiz_questions]),
+            'quiz_id',
+            'order',
+        )
+        
+        # Create options
+        QuizOption.objects.bulk_create([
+            QuizOption(
+                question=question,
+                option_text=option_text,
+                is_correct=(opt_order == question_data['correct_answer']),
+                order=opt_order
+            )
+            for question, question_data in zip(questions, questions_data)
+            for opt_order, option_text in enumerate(question_data['options'], start=1)
+        ])
+        return questions
 
     # Module 1 Questions - Web Services & REST Introduction
     def get_module1_questions(self):
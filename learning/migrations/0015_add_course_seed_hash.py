@@ -0,0 +1,23 @@
+# Generated by Django 4.2.9 on 2026-10-17 01:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("learning", "0014_add_profile_image"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="course",
+            name="seed_hash",
+            field=models.CharField(
+                blank=True,
+                editable=False,
+                help_text="Digest of the seed data last loaded by a seed command",
+                max_length=64,
+            ),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.9 on 2026-10-17 01:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("learning", "0015_add_course_seed_hash"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="course",
+            name="title",
+            field=models.CharField(db_index=True, max_length=200),
+        ),
+    ]
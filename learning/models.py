@@ -61,12 +61,13 @@ class Course(models.Model):
         ('other', 'Other'),
     ]
     
-    title = models.CharField(max_length=200)
+    title = models.CharField(max_length=200, db_index=True)
     description = models.TextField()
     category = models.CharField(max_length=50, choices=CATEGORY_CHOICES, default='other')
     created_at = models.DateTimeField(auto_now_add=True)
     is_featured = models.BooleanField(default=False)
     order = models.PositiveSmallIntegerField(default=1, help_text='Display order in course list (lower numbers appear first)')
+    seed_hash = models.CharField(max_length=64, blank=True, editable=False, help_text='Digest of the seed data last loaded by a seed command')
     
     class Meta:
         ordering = ['order', '-created_at']
@@ -1,3 +1,75 @@
-from django.test import TestCase
+import json
+from io import StringIO
 
-# Create your tests here.
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase
+
+from learning.management.commands import seed_java_course
+from learning.models import QuizOption, QuizQuestion
+
+
+class JavaCourseSeedDataTests(SimpleTestCase):
+    def test_correct_index_points_at_the_right_option(self):
+        with open(seed_java_course.DATA_FILE, encoding='utf-8') as f:
+            raw_modules = json.load(f)
+
+        for raw_module, module_data in zip(raw_modules, seed_java_course.load_modules_data()):
+            for raw_question, question in zip(raw_module['questions'], module_data['questions']):
+                with self.subTest(question=raw_question['question']):
+                    self.assertEqual(
+                        question.options[question.correct],
+                        raw_question['options'][raw_question['correct_answer'] - 1],
+                    )
+
+
+class JavaCourseReseedTests(TestCase):
+    def seed(self, *args):
+        out = StringIO()
+        call_command('seed_java_course', *args, stdout=out)
+        return out.getvalue()
+
+    def snapshot(self):
+        questions = QuizQuestion.objects.filter(quiz__module__course__title=seed_java_course.COURSE_TITLE)
+        return [
+            (question.quiz.module.order, question.order, question.question_text, question.question_type, question.points, [
+                (option.order, option.option_text, option.is_correct)
+                for option in question.options.order_by('order')
+            ])
+            for question in questions.select_related('quiz__module').order_by('quiz__module__order', 'order')
+        ]
+
+    def test_force_reseed_repairs_tampered_quiz_in_place(self):
+        self.seed()
+        fresh = self.snapshot()
+        questions = list(
+            QuizQuestion.objects.filter(
+                quiz__module__course__title=seed_java_course.COURSE_TITLE, quiz__module__order=1
+            ).order_by('order')
+        )
+        quiz = questions[0].quiz
+        original_pks = {question.order: question.pk for question in questions}
+
+        questions[0].question_text = 'Tampered'
+        questions[0].save()
+        questions[5].points = 5
+        questions[5].save()
+        flipped = questions[1].options.get(is_correct=True)
+        flipped.is_correct = False
+        flipped.save()
+        duplicate = QuizQuestion.objects.create(quiz=quiz, question_text='Duplicate', order=3)
+        QuizOption.objects.create(question=duplicate, option_text='Extra', order=1)
+        QuizOption.objects.create(question=questions[3], option_text='Extra', order=5)
+        questions[4].delete()
+
+        output = self.seed('--force')
+
+        self.assertEqual(self.snapshot(), fresh)
+        kept_pks = dict(QuizQuestion.objects.filter(quiz=quiz).values_list('order', 'pk'))
+        self.assertNotIn(duplicate.pk, kept_pks.values())
+        for order, pk in original_pks.items():
+            if order != questions[4].order:
+                self.assertEqual(kept_pks[order], pk)
+        self.assertIn(
+            'Synced questions: 1 created, 2 updated, 1 deleted; options: 4 created, 1 updated, 2 deleted', output
+        )
+        self.assertEqual(output.count('unchanged'), len(seed_java_course.load_modules_data()) - 1)